@@ -1,9 +1,59 @@
 import streamlit as st
 st.set_page_config(page_title="ISA Portfolio Dashboard", layout="wide")  # 반드시 첫 Streamlit 명령어
+import threading
 import pandas as pd
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
-from data_module import get_portfolio_performance, PORTFOLIO_CONFIG
+from data_module import get_portfolio_performance, prefetch_all_etf_prices, PORTFOLIO_CONFIG
+
+
+# 누적 수익률 차트 생성 - Figure 객체 자체를 (포트폴리오, 마지막 날짜) 기준으로
+# 메모이즈 (cache_resource: Figure는 해시/직렬화 비용 없이 동일 객체 재사용)
+# ttl은 성과 캐시와 동일하게 1시간 - 장중에 당일 종가가 갱신돼도 차트가 따라간다
+@st.cache_resource(ttl=3600)
+def build_cum_return_fig(portfolio_name: str, last_date: str,
+                         _prices_idx, _prices_val) -> go.Figure:
+    normalized = (_prices_val / _prices_val[0] - 1) * 100
+
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=_prices_idx,
+        y=normalized,
+        mode='lines',
+        name='누적 수익률',
+        line=dict(width=2, color='#1f77b4'),
+        fill='tozeroy'
+    ))
+
+    fig.update_layout(
+        hovermode='x unified',
+        height=400,
+        xaxis_title="날짜",
+        yaxis_title="누적 수익률 (%)",
+        showlegend=False
+    )
+    return fig
+
+
+# 포트폴리오 구성 테이블 생성 - 설정은 정적이므로 포트폴리오명 기준 메모이즈
+@st.cache_resource
+def build_etf_table(portfolio_name: str) -> pd.DataFrame:
+    etf_data = []
+    for etf_name, etf_info in PORTFOLIO_CONFIG[portfolio_name].etfs:
+        weight = etf_info.weight
+        if weight > 0:
+            etf_data.append({
+                'ETF': etf_name,
+                '비중': f"{weight*100:.1f}%",
+                '설명': etf_info.description or '상품 설명 없음'
+            })
+    return pd.DataFrame(etf_data)
+
+
+# 앱 시작 시 전체 티커를 백그라운드로 받아 디스크 캐시 예열 (세션당 한 번)
+if 'prefetch_started' not in st.session_state:
+    st.session_state.prefetch_started = True
+    threading.Thread(target=prefetch_all_etf_prices, daemon=True).start()
 
 st.title("📊 ISA 포트폴리오 대시보드")
 
@@ -15,12 +65,18 @@ with st.sidebar:
         list(PORTFOLIO_CONFIG.keys())
     )
     
+    mdd_window = st.selectbox(
+        "MDD 산정 기간",
+        ['전체 기간', '20일', '60일', '120일']
+    )
+    mdd_lookback = None if mdd_window == '전체 기간' else int(mdd_window.rstrip('일'))
+
     st.markdown("---")
-    st.info(f"🎯 목표 샤프 비율: {PORTFOLIO_CONFIG[portfolio]['target_sharpe']}")
-    st.info(f"📝 {PORTFOLIO_CONFIG[portfolio].get('description', '포트폴리오 설명 없음')}")
+    st.info(f"🎯 목표 샤프 비율: {PORTFOLIO_CONFIG[portfolio].target_sharpe}")
+    st.info(f"📝 {PORTFOLIO_CONFIG[portfolio].description or '포트폴리오 설명 없음'}")
 
 # 포트폴리오 성과 조회
-perf = get_portfolio_performance(portfolio)
+perf = get_portfolio_performance(portfolio, mdd_lookback)
 
 if perf:
     # 메트릭 표시
@@ -56,50 +112,24 @@ if perf:
     st.markdown("---")
     st.subheader("📈 누적 수익률")
     
-    fig = go.Figure()
-    prices = perf['prices']
-    normalized = (prices / prices.iloc[0] - 1) * 100
-    
-    fig.add_trace(go.Scatter(
-        x=normalized.index,
-        y=normalized.values,
-        mode='lines',
-        name='누적 수익률',
-        line=dict(width=2, color='#1f77b4'),
-        fill='tozeroy'
-    ))
-    
-    fig.update_layout(
-        hovermode='x unified',
-        height=400,
-        xaxis_title="날짜",
-        yaxis_title="누적 수익률 (%)",
-        showlegend=False
+    fig = build_cum_return_fig(
+        portfolio, perf['last_updated'],
+        perf['prices_idx'], perf['prices_val']
     )
-    
     st.plotly_chart(fig, use_container_width=True)
     
     # 포트폴리오 구성
     st.markdown("---")
     st.subheader("🎲 포트폴리오 구성")
     
-    etf_data = []
-    for etf_name, etf_info in PORTFOLIO_CONFIG[portfolio]['etfs'].items():
-        weight = etf_info['weight']
-        if weight > 0:
-            etf_data.append({
-                'ETF': etf_name,
-                '비중': f"{weight*100:.1f}%",
-                '설명': etf_info.get('description', '상품 설명 없음')
-            })
-    
-    if etf_data:
-        df = pd.DataFrame(etf_data)
+    df = build_etf_table(portfolio)
+
+    if not df.empty:
         st.dataframe(df, use_container_width=True, hide_index=True)
         
         # 포트폴리오 설명
         st.markdown("---")
-        st.info(f"📌 **포트폴리오 설명**: {PORTFOLIO_CONFIG[portfolio].get('description', '')}")
+        st.info(f"📌 **포트폴리오 설명**: {PORTFOLIO_CONFIG[portfolio].description}")
     else:
         st.info("포트폴리오 데이터 없음")
     
@@ -107,7 +137,7 @@ if perf:
     from data_module import calculate_periodic_returns
     st.markdown("---")
     st.subheader("📅 기간별 수익률")
-    period_returns = calculate_periodic_returns(perf['prices'])
+    period_returns = calculate_periodic_returns(perf['prices_val'])
     period_df = pd.DataFrame(period_returns, index=["수익률(%)"]).T
     st.dataframe(period_df, use_container_width=True, hide_index=False)
     
@@ -120,18 +150,18 @@ if perf:
     with col1:
         st.metric(
             "데이터 기간",
-            f"{len(perf['prices'])}일"
+            f"{len(perf['prices_val'])}일"
         )
-    
+
     with col2:
-        daily_return = perf['returns'].mean() * 100
+        daily_return = perf['returns_val'].mean() * 100
         st.metric(
             "평균 일일 수익률",
             f"{daily_return:.4f}%"
         )
-    
+
     with col3:
-        daily_volatility = perf['returns'].std() * 100
+        daily_volatility = perf['returns_val'].std(ddof=1) * 100
         st.metric(
             "일일 변동성",
             f"{daily_volatility:.4f}%"
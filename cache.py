@@ -0,0 +1,119 @@
+import hashlib
+import json
+import math
+import os
+import time
+from datetime import datetime
+from functools import wraps
+from pathlib import Path
+
+import pandas as pd
+from pytz import timezone
+
+# 시간대 설정
+KST = timezone('Asia/Seoul')
+
+# 캐시 저장 경로
+CACHE_DIR = Path('.cache')
+
+
+class FileCache:
+    """
+    (ticker, start, end) 키 기반의 영구 파일 캐시
+    - 데이터: .cache/{ticker}_{md5(ticker|start|end)}.parquet
+    - 메타: .cache/{ticker}_{md5(ticker|start|end)}.json ({timestamp, ttl})
+    """
+
+    def __init__(self, cache_dir=CACHE_DIR):
+        self.cache_dir = Path(cache_dir)
+
+    def _base_path(self, ticker: str, key: str) -> Path:
+        return self.cache_dir / f"{ticker}_{key}"
+
+    def get(self, ticker: str, key: str, columns=None):
+        """
+        TTL 이내의 캐시가 있으면 DataFrame, 없거나 만료되면 None 반환
+        columns를 주면 parquet에서 해당 컬럼만 읽는다 (컬럼 프루닝)
+        """
+        base = self._base_path(ticker, key)
+        data_path = base.with_suffix('.parquet')
+        meta_path = base.with_suffix('.json')
+
+        if not (data_path.exists() and meta_path.exists()):
+            return None
+
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+
+            if time.time() - meta['timestamp'] >= meta['ttl']:
+                return None
+
+            return pd.read_parquet(
+                data_path,
+                engine='pyarrow',
+                columns=list(columns) if columns is not None else None
+            )
+        except Exception as e:
+            print(f"[WARN] 캐시 읽기 실패 ({data_path.name}): {e}")
+            return None
+
+    def set(self, ticker: str, key: str, df: pd.DataFrame, ttl: float):
+        """DataFrame과 메타 정보를 임시 파일에 쓴 뒤 os.replace로 원자적 교체"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        base = self._base_path(ticker, key)
+        data_path = base.with_suffix('.parquet')
+        meta_path = base.with_suffix('.json')
+
+        try:
+            tmp_data = data_path.with_suffix('.parquet.tmp')
+            # zstd 압축: pickle/CSV 대비 수 배 작고 pyarrow 읽기는 멀티스레드
+            df.to_parquet(tmp_data, engine='pyarrow',
+                          compression='zstd', compression_level=3)
+            os.replace(tmp_data, data_path)
+
+            tmp_meta = meta_path.with_suffix('.json.tmp')
+            with open(tmp_meta, 'w', encoding='utf-8') as f:
+                json.dump({'timestamp': time.time(), 'ttl': ttl}, f)
+            os.replace(tmp_meta, meta_path)
+        except Exception as e:
+            print(f"[WARN] 캐시 쓰기 실패 ({data_path.name}): {e}")
+
+
+def krx_ttl(end_date: str) -> float:
+    """
+    KRX 일별 종가 갱신 주기에 맞춘 TTL
+    - 조회 구간이 오늘 이전에 끝나면 데이터가 더 이상 변하지 않으므로 무기한
+    - 오늘을 포함하면 장중 갱신을 고려해 4시간
+    """
+    today = datetime.now(KST).strftime('%Y%m%d')
+    return math.inf if end_date < today else 4 * 3600
+
+
+def disk_cache(ttl_fn=krx_ttl, columns=None):
+    """
+    (ticker, start_date, end_date) 시그니처의 조회 함수를 파일 캐시로 감싸는 데코레이터
+    캐시 히트 시 네트워크 호출 없이 로컬 parquet을 읽어 반환
+    columns를 주면 히트/미스 모두 해당 컬럼만 반환 (사용하는 컬럼만 I/O)
+    """
+    cache = FileCache()
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(ticker: str, start_date: str, end_date: str):
+            key = hashlib.md5(f"{ticker}|{start_date}|{end_date}".encode()).hexdigest()
+
+            cached = cache.get(ticker, key, columns=columns)
+            if cached is not None:
+                return cached
+
+            df = func(ticker, start_date, end_date)
+
+            if df is not None and not df.empty:
+                cache.set(ticker, key, df, ttl_fn(end_date))
+                if columns is not None:
+                    df = df[list(columns)]
+
+            return df
+        return wrapper
+    return decorator
@@ -0,0 +1,16 @@
+from functools import lru_cache
+from pathlib import Path
+
+import orjson
+
+# 설정 파일 경로
+CONFIG_PATH = Path('config.json')
+
+
+@lru_cache(maxsize=1)
+def get_config() -> dict:
+    """
+    config.json을 프로세스당 한 번만 읽고 파싱해 모든 모듈이 공유
+    (orjson은 stdlib json보다 2~3배 빠르게 파싱)
+    """
+    return orjson.loads(CONFIG_PATH.read_bytes())
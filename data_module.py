@@ -1,35 +1,123 @@
 import pandas as pd
-import json
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
+from types import MappingProxyType
 from pytz import timezone
 from pykrx import stock
 import numpy as np
+import requests
+from requests.adapters import HTTPAdapter
 import streamlit as st
+from cache import disk_cache
+from config_loader import get_config
 
 # 시간대 설정
 KST = timezone('Asia/Seoul')
 
-# config.json 로드 - 캐싱을 통해 반복적인 파일 읽기 방지
-@st.cache_data
-def load_config():
-    with open('config.json', 'r', encoding='utf-8') as f:
-        return json.load(f)
+# 설치되어 있으면 pandas 집계가 bottleneck의 SIMD 친화적 루프를 타도록 명시
+try:
+    import bottleneck  # noqa: F401
+    pd.set_option('compute.use_bottleneck', True)
+except ImportError:
+    pass
+
+
+class _PooledRequests:
+    """requests 모듈 인터페이스를 유지하면서 get/post만 풀링된 세션으로 위임"""
+
+    def __init__(self, session: requests.Session):
+        self.get = session.get
+        self.post = session.post
+
+    def __getattr__(self, name):
+        return getattr(requests, name)
+
+
+def _install_krx_session():
+    """
+    pykrx 내부 HTTP 호출이 keepalive 커넥션 풀을 재사용하도록 설정
+    종목 수만큼 반복되던 TLS/TCP 핸드셰이크를 제거
+    """
+    try:
+        from pykrx.website.comm import webio
+    except ImportError:
+        return
+
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=16)
+
+    # 신버전 pykrx: 모듈이 들고 있는 공유 세션에 커넥션 풀 장착
+    krxs = getattr(webio, 'get_session', lambda: None)()
+    inner = getattr(krxs, 'session', krxs)
+    if inner is not None and hasattr(inner, 'mount'):
+        inner.mount('https://', adapter)
+
+    # 구버전 pykrx: 모듈 수준 requests.get/post 직접 호출을 풀링된 세션으로 위임
+    pooled = requests.Session()
+    pooled.mount('https://', adapter)
+    webio.requests = _PooledRequests(pooled)
+
+
+_install_krx_session()
+
+
+# 읽기 전용 설정 객체 - dict 조회 대신 C 레벨 슬롯 접근, 실수로 수정하면 에러
+@dataclass(frozen=True, slots=True)
+class ETF:
+    ticker: str
+    weight: float
+    description: str = ''
+
 
+@dataclass(frozen=True, slots=True)
+class Portfolio:
+    target_sharpe: float
+    description: str
+    etfs: tuple  # ((etf_name, ETF), ...)
+
+
+def _build_portfolio_config(raw_portfolios: dict) -> MappingProxyType:
+    """config.json의 portfolios 딕셔너리를 불변 타입 객체로 변환"""
+    portfolios = {}
+    for name, p in raw_portfolios.items():
+        etfs = tuple(
+            (etf_name, ETF(
+                ticker=etf_info['ticker'],
+                weight=etf_info['weight'],
+                description=etf_info.get('description', '')
+            ))
+            for etf_name, etf_info in p['etfs'].items()
+        )
+        portfolios[name] = Portfolio(
+            target_sharpe=p.get('target_sharpe', 0),
+            description=p.get('description', ''),
+            etfs=etfs
+        )
+    return MappingProxyType(portfolios)
+
+
+# config.json 로드 - config_loader에서 한 번만 파싱해 공유
 try:
-    CONFIG = load_config()
-    PORTFOLIO_CONFIG = CONFIG['portfolios']
+    CONFIG = get_config()
+    PORTFOLIO_CONFIG = _build_portfolio_config(CONFIG['portfolios'])
 except Exception as e:
     st.error(f"설정 파일을 로드하는 중 오류가 발생했습니다: {e}")
-    PORTFOLIO_CONFIG = {}
+    PORTFOLIO_CONFIG = MappingProxyType({})
 
 @st.cache_data(ttl=3600)
 def get_etf_price(ticker: str, start_date: str = '20241209', end_date: str = None) -> pd.DataFrame:
     """
-    ETF 가격 데이터 조회 (캐싱 적용)
+    ETF 가격 데이터 조회 (인메모리 + 파일 캐싱 적용)
     """
     if end_date is None:
         end_date = datetime.now(KST).strftime('%Y%m%d')
-    
+
+    return _fetch_etf_price(ticker, start_date, end_date)
+
+
+@disk_cache(columns=('종가',))
+def _fetch_etf_price(ticker: str, start_date: str, end_date: str) -> pd.DataFrame:
+    """KRX에서 시세 조회 (디스크 캐시 미스 시에만 네트워크 호출, 종가만 반환)"""
     try:
         df = stock.get_market_ohlcv(start_date, end_date, ticker)
         return df
@@ -38,16 +126,58 @@ def get_etf_price(ticker: str, start_date: str = '20241209', end_date: str = Non
         return pd.DataFrame()
 
 
-def calculate_mdd(prices: pd.Series) -> float:
+def prefetch_all_etf_prices():
+    """
+    전체 포트폴리오의 모든 티커를 미리 받아 디스크 캐시를 예열
+    (앱 시작 시 백그라운드 스레드에서 호출 - 포트폴리오 전환 시
+    콜드 네트워크 경로를 제거한다)
+    """
+    start_date = '20241209'
+    end_date = datetime.now(KST).strftime('%Y%m%d')
+
+    tickers = {
+        etf.ticker
+        for portfolio in PORTFOLIO_CONFIG.values()
+        for _, etf in portfolio.etfs
+        if etf.weight > 0
+    }
+
+    if not tickers:
+        return
+
+    with ThreadPoolExecutor(max_workers=min(8, len(tickers))) as executor:
+        list(executor.map(
+            lambda ticker: _fetch_etf_price(ticker, start_date, end_date),
+            tickers
+        ))
+
+
+def calculate_mdd(prices: pd.Series, inception: float = None,
+                  lookback: int = None) -> float:
     """
     최대 낙폭(MDD) 계산
+    expanding().max() 대신 np.maximum.accumulate로 벡터화 (C 루프 한 번)
+
+    inception이 주어지면 시계열 맨 앞에 가상의 투자원금 시점을 추가해
+    첫 관측일의 하락도 낙폭에 포함시킨다. (ISA 포트폴리오는 원금 100에서
+    시작하므로 get_portfolio_performance는 inception=100.0을 넘긴다)
+
+    lookback이 주어지면 전체 기간 고점 대신 최근 lookback 영업일의
+    이동 최대값 대비 낙폭을 계산한다 (bottleneck.move_max, 전체 O(N))
     """
     if len(prices) < 2:
         return 0
-    
-    cummax = prices.expanding().max()
-    drawdown = (prices - cummax) / cummax * 100
-    return float(drawdown.min())
+
+    arr = prices.to_numpy(dtype=np.float64, copy=False)
+    if lookback is None:
+        if inception is not None:
+            arr = np.concatenate(([inception], arr))
+        cummax = np.maximum.accumulate(arr)
+    else:
+        import bottleneck as bn
+        # 시계열이 lookback보다 짧으면 전체 기간 MDD로 자연스럽게 수렴
+        cummax = bn.move_max(arr, window=min(lookback, len(arr)), min_count=1)
+    return float(((arr - cummax) / cummax).min() * 100)
 
 
 def calculate_sharpe_ratio(returns: pd.Series, risk_free_rate: float = 0.02) -> float:
@@ -68,38 +198,117 @@ def calculate_sharpe_ratio(returns: pd.Series, risk_free_rate: float = 0.02) ->
     return float(sharpe)
 
 
-def get_portfolio_performance(portfolio_name: str) -> dict:
+try:
+    from numba import njit
+except ImportError:  # numba 미설치 환경에서는 numpy 경로로 동작
+    njit = None
+
+
+def _perf_kernel_py(arr: np.ndarray, inception: float) -> tuple:
+    """
+    지수 배열 한 번 순회로 (MDD %, 로그 수익률 평균, 로그 수익률 표준편차) 계산
+    numba가 있으면 AVX로 자동 벡터화된 JIT 버전이 이 함수를 대체한다
+    """
+    n = arr.shape[0]
+    peak = inception
+    if arr[0] > peak:
+        peak = arr[0]
+    mdd = (arr[0] - peak) / peak
+    s = 0.0
+    s2 = 0.0
+    for i in range(1, n):
+        r = np.log(arr[i] / arr[i - 1])
+        s += r
+        s2 += r * r
+        if arr[i] > peak:
+            peak = arr[i]
+        dd = (arr[i] - peak) / peak
+        if dd < mdd:
+            mdd = dd
+    mean = s / (n - 1)
+    var = s2 / (n - 1) - mean * mean
+    if var < 0.0:
+        var = 0.0
+    return mdd * 100.0, mean, var ** 0.5
+
+
+if njit is not None:
+    # cache=True로 컴파일 결과를 디스크에 남겨 Streamlit 리런 시 웜업 제거
+    _perf_kernel = njit(cache=True, fastmath=True)(_perf_kernel_py)
+else:
+    _perf_kernel = None
+
+
+def _perf_stats(arr: np.ndarray, inception: float = None,
+                risk_free_rate: float = 0.02) -> tuple:
+    """
+    포트폴리오 지수 배열에서 연환산 수익률(%), 샤프 비율, MDD(%)를 한 번에 계산
+    pct_change/expanding을 각각 돌리는 대신 같은 배열 위에서 로그 수익률과
+    누적 최대값을 묶어서 구한다 (일간 규모에서 로그 수익률 ≈ 단순 수익률)
+    """
+    if len(arr) < 2:
+        return 0.0, 0.0, 0.0
+
+    arr = np.ascontiguousarray(arr, dtype=np.float64)
+    base = arr[0] if inception is None else inception
+
+    if _perf_kernel is not None:
+        mdd, mean, std = _perf_kernel(arr, base)
+    else:
+        logret = np.diff(np.log(arr))
+        mean = logret.mean()
+        std = logret.std()
+        ext = np.concatenate(([base], arr))
+        cummax = np.maximum.accumulate(ext)
+        mdd = ((ext - cummax) / cummax).min() * 100
+
+    annual_return = mean * 252
+    annual_std = std * np.sqrt(252)
+    sharpe = (annual_return - risk_free_rate) / annual_std if annual_std > 0 else 0.0
+
+    return float(annual_return * 100), float(sharpe), float(mdd)
+
+
+@st.cache_data(ttl=3600, show_spinner="포트폴리오 성과 계산 중...")
+def get_portfolio_performance(portfolio_name: str, mdd_lookback: int = None) -> dict:
     """
     포트폴리오 전체 성과 계산 (2024년 12월 9일부터)
+    리런마다 재계산하지 않도록 포트폴리오명 기준으로 1시간 캐싱
+    mdd_lookback을 주면 MDD를 전체 기간 대신 최근 N영업일 기준으로 계산
     """
     if portfolio_name not in PORTFOLIO_CONFIG:
         return {}
     
     config = PORTFOLIO_CONFIG[portfolio_name]
-    etfs = config['etfs']
-    
+    etfs = dict(config.etfs)
+
     start_date = '20241209'
     end_date = datetime.now(KST).strftime('%Y%m%d')
-    
-    # 데이터 수집 및 병합
-    price_df = pd.DataFrame()
-    
-    for etf_name, etf_info in etfs.items():
-        ticker = etf_info['ticker']
-        weight = etf_info['weight']
-        
-        if weight <= 0:
-            continue
-            
-        df = get_etf_price(ticker, start_date, end_date)
-        
-        if not df.empty and '종가' in df.columns:
-            # 첫 번째 데이터면 인덱스 설정, 아니면 조인
-            if price_df.empty:
-                price_df[etf_name] = df['종가']
-            else:
-                price_df = price_df.join(df['종가'].rename(etf_name), how='outer')
-    
+
+    # 데이터 수집 (종목별 KRX 조회는 독립적인 I/O이므로 병렬 처리)
+    tasks = [
+        (etf_name, etf.ticker)
+        for etf_name, etf in config.etfs
+        if etf.weight > 0
+    ]
+
+    if not tasks:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=min(8, len(tasks))) as executor:
+        results = list(executor.map(
+            lambda t: (t[0], get_etf_price(t[1], start_date, end_date)),
+            tasks
+        ))
+
+    # 병합 (반복 join 대신 concat 한 번으로 처리)
+    series_list = [
+        df['종가'].rename(etf_name)
+        for etf_name, df in results
+        if not df.empty and '종가' in df.columns
+    ]
+    price_df = pd.concat(series_list, axis=1, join='outer') if series_list else pd.DataFrame()
+
     if price_df.empty:
         return {}
     
@@ -111,29 +320,39 @@ def get_portfolio_performance(portfolio_name: str) -> dict:
     
     # 포트폴리오 가중치 적용 가격 지수 계산
     # (각 자산의 시작가를 100으로 정규화한 뒤 가중치 적용)
-    normalized_prices = price_df / price_df.iloc[0] * 100
-    portfolio_index = pd.Series(0.0, index=price_df.index)
-    
-    for etf_name in price_df.columns:
-        weight = etfs[etf_name]['weight']
-        portfolio_index += normalized_prices[etf_name] * weight
+    weights = np.fromiter(
+        (etfs[etf_name].weight for etf_name in price_df.columns),
+        dtype=np.float64,
+        count=len(price_df.columns)
+    )
+    # 판다스 블록 연산 대신 numpy 브로드캐스트로 정규화한 뒤 행렬-벡터 곱
+    vals = price_df.to_numpy(dtype=np.float64, copy=False)
+    portfolio_index = pd.Series(
+        (vals / vals[0:1]) @ weights * 100.0,
+        index=price_df.index,
+        name='portfolio'
+    )
     
-    # 지표 계산
+    # 지표 계산 (연환산 수익률/샤프/MDD를 한 번의 스캔으로)
     daily_returns = portfolio_index.pct_change().dropna()
-    
+
     total_return = (portfolio_index.iloc[-1] / portfolio_index.iloc[0] - 1) * 100
-    mdd = calculate_mdd(portfolio_index)
-    sharpe = calculate_sharpe_ratio(daily_returns)
-    annual_return = daily_returns.mean() * 252 * 100  # 연환산 수익률(%)
+    annual_return, sharpe, mdd = _perf_stats(
+        portfolio_index.to_numpy(dtype=np.float64), inception=100.0
+    )
+    if mdd_lookback is not None:
+        mdd = calculate_mdd(portfolio_index, lookback=mdd_lookback)
 
+    # 시계열은 (인덱스 배열, 값 배열) 쌍으로 반환 - Series 박싱 없이 바로 plotly/numpy 소비
     return {
         'total_return': total_return,
         'annual_return': annual_return,  # 추가
         'mdd': mdd,
         'sharpe_ratio': sharpe,
-        'target_sharpe': config.get('target_sharpe', 0),
-        'prices': portfolio_index,
-        'returns': daily_returns,
+        'target_sharpe': config.target_sharpe,
+        'prices_idx': portfolio_index.index.values,
+        'prices_val': portfolio_index.to_numpy(dtype=np.float64),
+        'returns_val': daily_returns.to_numpy(dtype=np.float64),
         'last_updated': price_df.index[-1].strftime('%Y-%m-%d') if not price_df.empty else None
     }
 
@@ -143,10 +362,12 @@ def get_portfolio_performance(portfolio_name: str) -> dict:
 
 # ...기존 코드...
 
-def calculate_periodic_returns(prices: pd.Series) -> dict:
+def calculate_periodic_returns(prices) -> dict:
     """
-    주어진 가격 시계열에서 기간별(1주, 1개월, 2개월, 3개월, 1년) 수익률을 계산
+    주어진 가격 시계열(ndarray 또는 pd.Series)에서
+    기간별(1주, 1개월, 2개월, 3개월, 1년) 수익률을 계산
     """
+    arr = np.asarray(prices, dtype=np.float64)
     periods = {
         '1주': 5,
         '1개월': 21,
@@ -156,9 +377,9 @@ def calculate_periodic_returns(prices: pd.Series) -> dict:
     }
     results = {}
     for label, days in periods.items():
-        if len(prices) >= days:
-            start_price = prices.iloc[-days]
-            end_price = prices.iloc[-1]
+        if len(arr) >= days:
+            start_price = arr[-days]
+            end_price = arr[-1]
             returns = (end_price - start_price) / start_price * 100
             results[label] = round(returns, 2)
         else: